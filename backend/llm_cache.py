@@ -0,0 +1,109 @@
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+import orjson
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+def normalize(text: str) -> str:
+    """Collapse whitespace so prompts differing only in spacing share a key."""
+    return " ".join(text.split())
+
+def cache_key(model: str, messages: List[Dict[str, str]], temperature: Optional[float]) -> str:
+    """Hash the canonicalized request payload."""
+    messages = [{**m, "content": normalize(m["content"])} for m in messages]
+    payload = {"model": model, "messages": messages, "temperature": temperature}
+    return hashlib.sha256(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+# Shorter values (e.g. "A") occur inside too much unrelated text to replace safely
+MIN_LITERAL_LENGTH = 3
+
+def generalize(text: str, literals: Optional[Dict[str, str]]) -> str:
+    """Replace per-request literal values with their placeholders.
+    
+    Only whole words match, so "Book" is replaced in "Book" and "BookCreate"
+    but not in "Bookmark" or "eBook".
+    """
+    for placeholder, value in (literals or {}).items():
+        if value and len(value) >= MIN_LITERAL_LENGTH:
+            text = re.sub(rf"(?<![A-Za-z0-9]){re.escape(value)}(?![a-z0-9])", placeholder, text)
+    return text
+
+def specialize(text: str, literals: Optional[Dict[str, str]]) -> str:
+    """Substitute literal values back into a generalized cache entry."""
+    # Placeholders are distinct tokens, so a plain replace cannot hit unrelated text
+    for placeholder, value in (literals or {}).items():
+        if value:
+            text = text.replace(placeholder, value)
+    return text
+
+class LLMCache:
+    """In-memory LRU of LLM responses backed by a small SQLite file."""
+
+    def __init__(self, path: Path, ttl: float = 7 * 86400, max_entries: int = 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._memory: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        # Shared by every worker process; WAL lets readers proceed during a write
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache (key TEXT PRIMARY KEY, content TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_expires_at ON llm_cache (expires_at)")
+        self._conn.execute("DELETE FROM llm_cache WHERE expires_at < ?", (time.time(),))
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return cached content, or None on a miss or an expired entry."""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                row = self._conn.execute(
+                    "SELECT content, expires_at FROM llm_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    entry = (row[0], row[1])
+                    self._remember(key, entry)
+            else:
+                self._memory.move_to_end(key)
+            if entry is None or entry[1] < now:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key: str, content: str):
+        """Store content for key in memory and on disk, dropping expired rows."""
+        now = time.time()
+        entry = (content, now + self.ttl)
+        with self._lock:
+            self._remember(key, entry)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, content, expires_at) VALUES (?, ?, ?)",
+                (key, entry[0], entry[1]),
+            )
+            self._conn.execute("DELETE FROM llm_cache WHERE expires_at < ?", (now,))
+            self._conn.commit()
+
+    def _remember(self, key: str, entry: Tuple[str, float]):
+        """Keep entry in memory, evicting the least recently used beyond max_entries."""
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._memory)}
@@ -1,58 +1,344 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
-from pydantic import BaseModel
-from typing import List, Dict, Any, Optional
-from pathlib import Path
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, ORJSONResponse, StreamingResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+from pydantic import BaseModel, Field
+from typing import List, Dict, Any, AsyncIterator, Callable, Optional, Tuple
+from contextvars import ContextVar
+from functools import lru_cache
+from pathlib import Path, PurePosixPath
+from string import Template
+import asyncio
+import hashlib
+import logging
+import logging.handlers
+import os
+import queue
 import re
 import time
 import uuid
-import json
-import shutil
-from litellm import completion
+import zipfile
+import orjson
+import sqlite3
+import threading
+import httpx
 from dotenv import load_dotenv
+from llm_cache import MIN_LITERAL_LENGTH, LLMCache, cache_key, generalize, specialize
 
 # Load environment variables
 load_dotenv()
 
-app = FastAPI(title="AI App Generator Orchestrator", version="1.0")
+logger = logging.getLogger("orchestrator")
 
-# CORS configuration for Next.js frontend
+def configure_logging() -> logging.handlers.QueueListener:
+    """Route log records through a queue so handlers never block on stdout"""
+    # The module can be imported twice (as __main__ and as "orchestrator");
+    # reuse the first listener instead of logging every record twice
+    for handler in logger.handlers:
+        if isinstance(handler, logging.handlers.QueueHandler):
+            return handler.listener
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s"))
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    logger.addHandler(queue_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    queue_handler.listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    queue_handler.listener.start()
+    return queue_handler.listener
+
+log_listener = configure_logging()
+
+app = FastAPI(
+    title="AI App Generator Orchestrator",
+    version="1.0",
+    default_response_class=ORJSONResponse
+)
+
+# CORS configuration for Next.js frontend. ALLOWED_ORIGINS is comma-separated;
+# "*" allows any origin, which browsers only accept without credentials.
+ALLOWED_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("ALLOWED_ORIGINS", "http://localhost:3000,http://127.0.0.1:3000").split(",")
+    if origin.strip()
+]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["http://localhost:3000", "http://127.0.0.1:3000"],
-    allow_credentials=True,
+    allow_origins=ALLOWED_ORIGINS,
+    allow_credentials="*" not in ALLOWED_ORIGINS,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-# Simple JSON database for projects
-PROJECTS_DB_FILE = Path("projects_db.json")
-
-def load_projects_db():
-    """Load projects from JSON file"""
-    if PROJECTS_DB_FILE.exists():
-        with open(PROJECTS_DB_FILE, 'r') as f:
-            return json.load(f)
-    return {}
-
-def save_projects_db(projects):
-    """Save projects to JSON file"""
-    with open(PROJECTS_DB_FILE, 'w') as f:
-        json.dump(projects, f, indent=2)
-
-def save_project(project_id: str, schema: dict, status: str = "completed"):
-    """Save project metadata to database"""
-    projects = load_projects_db()
-    projects[project_id] = {
-        "id": project_id,
-        "entityName": schema.get("entityName", "Unknown"),
-        "created_at": time.time(),
-        "status": status,
-        "schema": schema,
-        "path": f"generated/{project_id}"
+# Set EXPOSE_ERROR_DETAILS=true in development to return exception text to clients
+EXPOSE_ERROR_DETAILS = os.getenv("EXPOSE_ERROR_DETAILS", "false").lower() == "true"
+
+def error_detail(message: str, e: Exception) -> str:
+    """Client-facing error text; the exception itself is only included when enabled."""
+    return f"{message}: {e}" if EXPOSE_ERROR_DETAILS else message
+
+class SelectiveGZipMiddleware(GZipMiddleware):
+    """GZipMiddleware that passes responses under the given path suffixes through untouched."""
+
+    def __init__(self, app: ASGIApp, skip_suffixes: Tuple[str, ...] = (), **kwargs: Any) -> None:
+        super().__init__(app, **kwargs)
+        self.skip_suffixes = skip_suffixes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"].endswith(self.skip_suffixes):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+# Compress JSON payloads and generated file contents; small responses are sent as-is.
+# ZIP downloads are already deflated, and GZipMiddleware buffers NDJSON streams
+# until they end, which would hold back every field event.
+GZIP_MINIMUM_SIZE = 1024
+app.add_middleware(
+    SelectiveGZipMiddleware,
+    skip_suffixes=("/download", "/stream"),
+    minimum_size=GZIP_MINIMUM_SIZE,
+    compresslevel=6
+)
+
+# Root of all generated projects, created once so requests only make their own directory
+GENERATED_DIR = Path("generated")
+GENERATED_DIR.mkdir(exist_ok=True)
+
+# SQLite database for projects
+PROJECTS_DB_FILE = Path("projects.db")
+LEGACY_PROJECTS_DB_FILE = Path("projects_db.json")
+
+def init_projects_db():
+    """Open the projects database, creating the table on first run"""
+    conn = sqlite3.connect(str(PROJECTS_DB_FILE), check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA cache_size=-64000")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS projects (
+            id TEXT PRIMARY KEY,
+            entity TEXT NOT NULL,
+            created_at REAL NOT NULL,
+            status TEXT NOT NULL,
+            schema_json TEXT NOT NULL,
+            path TEXT NOT NULL
+        )
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_projects_created_at ON projects (created_at)")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS project_files (
+            project_id TEXT NOT NULL,
+            path TEXT NOT NULL,
+            sha256 TEXT NOT NULL,
+            PRIMARY KEY (project_id, path)
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS jobs (
+            id TEXT PRIMARY KEY,
+            status TEXT NOT NULL,
+            progress TEXT,
+            result_json TEXT,
+            error TEXT,
+            created_at REAL NOT NULL
+        )
+    """)
+    # Import projects from the old JSON file once
+    empty = conn.execute("SELECT 1 FROM projects LIMIT 1").fetchone() is None
+    if empty and LEGACY_PROJECTS_DB_FILE.exists():
+        legacy = orjson.loads(LEGACY_PROJECTS_DB_FILE.read_bytes())
+        conn.executemany(
+            "INSERT OR REPLACE INTO projects VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (p["id"], p.get("entityName", "Unknown"), p.get("created_at", 0.0),
+                 p.get("status", "completed"), orjson.dumps(p.get("schema", {})).decode(), p.get("path", f"generated/{p['id']}"))
+                for p in legacy.values()
+            ]
+        )
+    conn.commit()
+    return conn
+
+projects_db = init_projects_db()
+# The connection is shared across threadpool workers; serialize access to it
+projects_db_lock = threading.Lock()
+
+def row_to_project(row) -> dict:
+    """Convert a projects row into the API representation"""
+    return {
+        "id": row[0],
+        "entityName": row[1],
+        "created_at": row[2],
+        "status": row[3],
+        "schema": orjson.loads(row[4]),
+        "path": row[5]
+    }
+
+def load_projects() -> List[dict]:
+    """Load all projects from the database, newest first"""
+    with projects_db_lock:
+        rows = projects_db.execute(
+            "SELECT id, entity, created_at, status, schema_json, path FROM projects ORDER BY created_at DESC"
+        ).fetchall()
+    return [row_to_project(row) for row in rows]
+
+def get_project(project_id: str) -> Optional[dict]:
+    """Load a single project, or None if it does not exist"""
+    with projects_db_lock:
+        row = projects_db.execute(
+            "SELECT id, entity, created_at, status, schema_json, path FROM projects WHERE id = ?",
+            (project_id,)
+        ).fetchone()
+    return row_to_project(row) if row else None
+
+def new_project_id() -> str:
+    """Generate an 8-character project id that is not already taken"""
+    while True:
+        project_id = uuid.uuid4().hex[:8]
+        with projects_db_lock:
+            exists = projects_db.execute("SELECT 1 FROM projects WHERE id = ?", (project_id,)).fetchone()
+        if exists is None and not Path(f"generated/{project_id}").exists():
+            return project_id
+
+def save_project(
+    project_id: str,
+    schema: dict,
+    status: str = "completed",
+    file_digests: Optional[Dict[str, str]] = None
+):
+    """Save project metadata and its file manifest to database"""
+    row = (
+        project_id,
+        schema.get("entityName", "Unknown"),
+        time.time(),
+        status,
+        orjson.dumps(schema).decode(),
+        f"generated/{project_id}"
+    )
+    with projects_db_lock:
+        projects_db.execute("INSERT OR REPLACE INTO projects VALUES (?, ?, ?, ?, ?, ?)", row)
+        if file_digests:
+            projects_db.executemany(
+                "INSERT OR REPLACE INTO project_files VALUES (?, ?, ?)",
+                [(project_id, path, digest) for path, digest in file_digests.items()]
+            )
+        projects_db.commit()
+
+def get_file_digest(project_id: str, path: str) -> Optional[str]:
+    """Return the SHA-256 recorded for a generated file, if any"""
+    with projects_db_lock:
+        row = projects_db.execute(
+            "SELECT sha256 FROM project_files WHERE project_id = ? AND path = ?",
+            (project_id, path)
+        ).fetchone()
+    return row[0] if row else None
+
+def create_job(job_id: str):
+    """Record a new pending background job"""
+    create_jobs([job_id])
+
+def create_jobs(job_ids: List[str]):
+    """Record several pending background jobs in one transaction"""
+    now = time.time()
+    with projects_db_lock:
+        projects_db.executemany(
+            "INSERT INTO jobs (id, status, progress, created_at) VALUES (?, 'pending', 'queued', ?)",
+            [(job_id, now) for job_id in job_ids]
+        )
+        projects_db.commit()
+
+def update_job(job_id: str, status: str, progress: str, result: Optional[dict] = None, error: Optional[str] = None):
+    """Update a background job's status, progress and outcome"""
+    result_json = orjson.dumps(result).decode() if result is not None else None
+    with projects_db_lock:
+        projects_db.execute(
+            "UPDATE jobs SET status = ?, progress = ?, result_json = ?, error = ? WHERE id = ?",
+            (status, progress, result_json, error, job_id)
+        )
+        projects_db.commit()
+
+def get_job(job_id: str) -> Optional[dict]:
+    """Load a background job, or None if it does not exist"""
+    with projects_db_lock:
+        row = projects_db.execute(
+            "SELECT id, status, progress, result_json, error FROM jobs WHERE id = ?",
+            (job_id,)
+        ).fetchone()
+    if row is None:
+        return None
+    return {
+        "jobId": row[0],
+        "status": row[1],
+        "progress": row[2],
+        "result": orjson.loads(row[3]) if row[3] else None,
+        "error": row[4]
     }
-    save_projects_db(projects)
+
+# LLM response cache, keyed by (model, messages, temperature) with per-request
+# literals such as the entity name replaced by placeholders
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+llm_cache = LLMCache(
+    Path("llm_cache.db"),
+    ttl=float(os.getenv("LLM_CACHE_TTL", str(7 * 86400))),
+    max_entries=int(os.getenv("LLM_CACHE_MAX_ENTRIES", "1024"))
+)
+ENTITY_PLACEHOLDER = "__ENTITY__"
+
+def entity_literals(entity_name: Optional[str]) -> Optional[Dict[str, str]]:
+    """Literals for a prompt about entity_name; short names stay in the prompt as-is."""
+    if entity_name and len(entity_name) >= MIN_LITERAL_LENGTH:
+        return {ENTITY_PLACEHOLDER: entity_name}
+    return None
+
+llm_cache_status: ContextVar[str] = ContextVar("llm_cache_status", default="MISS")
+
+# Caps concurrent outbound LLM calls per worker to stay under provider rate limits
+_LLM_SEM = asyncio.Semaphore(int(os.getenv("MAX_LLM_CONCURRENCY", "8")))
+
+# Set USE_LLM_SCHEMA=true to have the LLM write schema.py instead of the code generator
+USE_LLM_SCHEMA = os.getenv("USE_LLM_SCHEMA", "false").lower() == "true"
+
+@app.on_event("startup")
+async def open_http_client():
+    """Share one pooled HTTP client across all LiteLLM calls"""
+    app.state.http_client = httpx.AsyncClient(
+        limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+        timeout=60
+    )
+    # Only rebind if LiteLLM was already imported; otherwise get_litellm() picks the client up
+    if get_litellm.cache_info().currsize:
+        get_litellm().aclient_session = app.state.http_client
+
+@app.on_event("shutdown")
+async def close_http_client():
+    if get_litellm.cache_info().currsize:
+        get_litellm().aclient_session = None
+    await app.state.http_client.aclose()
+
+@app.on_event("shutdown")
+def close_databases():
+    """Flush the SQLite connections and pending log records on shutdown"""
+    with projects_db_lock:
+        projects_db.close()
+    llm_cache.close()
+    log_listener.stop()
+
+# Scaffolding templates for generated projects, loaded once at startup
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+
+def load_template(name: str) -> Template:
+    """Read a scaffolding template from the templates directory"""
+    return Template((TEMPLATES_DIR / name).read_text())
+
+SCHEMA_TPL = load_template("schema.py.tpl")
+API_TPL = load_template("api.py.tpl")
+FRONTEND_TPL = load_template("frontend.py.tpl")
+INDEX_TPL = load_template("index.html.tpl")
+REQUIREMENTS_TPL = load_template("requirements.txt.tpl")
+README_TPL = load_template("README.md.tpl")
 
 # Request/Response Models
 class GenerateSchemaRequest(BaseModel):
@@ -83,6 +369,12 @@ class GenerateAppRequest(BaseModel):
     schema: SchemaDefinition
     model: str = "gpt-4o-mini"
 
+# Upper bound on apps per batch request; larger lists are rejected with 422
+MAX_BATCH_APPS = int(os.getenv("MAX_BATCH_APPS", "10"))
+
+class GenerateAppBatchRequest(BaseModel):
+    apps: List[GenerateAppRequest] = Field(min_length=1, max_length=MAX_BATCH_APPS)
+
 class ValidationResult(BaseModel):
     success: bool
     errors: List[str]
@@ -92,795 +384,942 @@ class ValidationResult(BaseModel):
     projectId: str
 
 # Utility functions
+_FENCE_RE = re.compile(r"```[a-zA-Z]*\n?|```")
+_PROJECT_ID_RE = re.compile(r"^[0-9a-f]{8}$")
+
+# Shared by every LLM call; LiteLLM does not mutate the messages it is given
+_SYSTEM_MSG = {
+    "role": "system",
+    "content": "You are an expert database and application architect. Return structured, valid responses."
+}
+
+# Model families that do not accept a temperature parameter
+_NO_TEMP_PREFIXES = ("gpt-5", "o1", "o3", "o4")
+
+# Sampling params that models have rejected at runtime, so later calls skip the
+# failing attempt. Only models that actually failed are recorded here; the model
+# name comes from the client, so the prefix lookup below is a bounded LRU instead.
+_TUNING_PARAMS = ("temperature", "max_tokens")
+_MODEL_UNSUPPORTED: Dict[str, set] = {}
+
+@lru_cache(maxsize=256)
+def is_reasoning_model(model: str) -> bool:
+    """Whether model belongs to a family that rejects sampling params."""
+    # Match on the bare model name so "openai/gpt-5" is treated like "gpt-5"
+    return model.rpartition("/")[2].lower().startswith(_NO_TEMP_PREFIXES)
+
+def unsupported_params(model: str) -> set:
+    """Return the sampling params known to be rejected by model."""
+    if is_reasoning_model(model):
+        return set(_TUNING_PARAMS)
+    return set(_MODEL_UNSUPPORTED.get(model, ()))
+
 def clean_code(text: str) -> str:
     """Remove markdown-style fences."""
-    return re.sub(r"```[a-zA-Z]*\n?|```", "", text).strip()
+    s = text.strip()
+    fences = s.count("```")
+    if fences == 0:
+        return s
+    # Common case: one fenced block wrapping the whole response
+    if fences == 2 and s.startswith("```") and s.endswith("```"):
+        nl = s.find("\n")
+        lang = s[3:nl] if nl != -1 else ""
+        if nl != -1 and (not lang or lang.isascii() and lang.isalpha()):
+            return s[nl + 1:-3].strip()
+    return _FENCE_RE.sub("", s).strip()
+
+@lru_cache(maxsize=256)
+def pascal_to_snake(name: str) -> str:
+    """Convert a PascalCase entity name to snake_case (BookItem -> book_item)."""
+    return "".join(
+        "_" + c.lower() if i and "A" <= c <= "Z" else c.lower()
+        for i, c in enumerate(name)
+    )
+
+def extract_json_object(text: str) -> Optional[str]:
+    """Return the first balanced {...} object in text, skipping braces inside strings."""
+    start = text.find("{")
+    if start == -1:
+        return None
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
+
+class JsonItemScanner:
+    """Incrementally scan streamed JSON for objects inside the top-level object's arrays.
+    
+    For a schema response this yields each entry of "fields" as soon as its
+    closing brace arrives; anything before the first "{" (fences, prose) is skipped.
+    """
+
+    def __init__(self):
+        self.stack: List[str] = []
+        self.started = False
+        self.in_string = False
+        self.escaped = False
+        self.item: Optional[List[str]] = None
+
+    def feed(self, chunk: str) -> List[str]:
+        """Consume a chunk and return the text of any items it completed."""
+        items = []
+        for ch in chunk:
+            if not self.started:
+                if ch != "{":
+                    continue
+                self.started = True
+            if self.item is not None:
+                self.item.append(ch)
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif ch == "\\":
+                    self.escaped = True
+                elif ch == '"':
+                    self.in_string = False
+            elif ch == '"':
+                self.in_string = True
+            elif ch == "{" or ch == "[":
+                # An item is an object whose parent is an array of the top-level object
+                if ch == "{" and self.stack == ["{", "["] and self.item is None:
+                    self.item = [ch]
+                self.stack.append(ch)
+            elif ch == "}" or ch == "]":
+                if self.stack:
+                    self.stack.pop()
+                if ch == "}" and self.stack == ["{", "["] and self.item is not None:
+                    items.append("".join(self.item))
+                    self.item = None
+        return items
 
-def ask_model(model: str, prompt: str, temperature: float = 0.4):
-    """Call LLM via LiteLLM."""
+# Field type -> (SQLAlchemy column type, Python annotation)
+TYPE_MAP = {
+    "string": ("String(255)", "str"),
+    "email": ("String(320)", "str"),
+    "text": ("Text", "str"),
+    "number": ("Integer", "int"),
+    "boolean": ("Boolean", "bool"),
+    "date": ("Date", "date"),
+}
+
+def render_sqlalchemy_model(schema: SchemaDefinition) -> str:
+    """Generate SQLAlchemy 2.0 model code for an entity without an LLM call."""
+    columns = []
+    if "id" not in {f.name for f in schema.fields}:
+        columns.append("    id: Mapped[int] = mapped_column(Integer, primary_key=True)")
+    for field in schema.fields:
+        column_type, py_type = TYPE_MAP.get(field.type, TYPE_MAP["string"])
+        if field.name == "id":
+            columns.append(f"    id: Mapped[{py_type}] = mapped_column({column_type}, primary_key=True)")
+        elif field.required:
+            columns.append(f"    {field.name}: Mapped[{py_type}] = mapped_column({column_type}, nullable=False)")
+        else:
+            columns.append(f"    {field.name}: Mapped[Optional[{py_type}]] = mapped_column({column_type}, nullable=True)")
+    
+    return SCHEMA_TPL.substitute(
+        entity=schema.entityName,
+        table_name=pascal_to_snake(schema.entityName) + "s",
+        columns="\n".join(columns)
+    )
+
+# Field type -> Python annotation for the generated Form(...) parameters
+_PY_TYPE_MAP = {
+    "string": "str",
+    "email": "str",
+    "text": "str",
+    "number": "int",
+    "boolean": "bool",
+    "date": "date",
+}
+
+# Field type -> HTML input type; anything else renders as a text input
+INPUT_TYPE_MAP = {
+    "number": "number",
+    "email": "email",
+    "date": "date",
+    "boolean": "checkbox",
+}
+
+def _textarea_input(name: str, label: str, field_type: str, required: str) -> str:
+    return f'''
+            <div class="form-group">
+                <label for="{name}">{label}:</label>
+                <textarea id="{name}" name="{name}" rows="3" {required}></textarea>
+            </div>'''
+
+def _checkbox_input(name: str, label: str, field_type: str, required: str) -> str:
+    return f'''
+            <div class="form-group checkbox">
+                <label>
+                    <input type="checkbox" id="{name}" name="{name}" value="true">
+                    {label}
+                </label>
+            </div>'''
+
+def _basic_input(name: str, label: str, field_type: str, required: str) -> str:
+    return f'''
+            <div class="form-group">
+                <label for="{name}">{label}:</label>
+                <input type="{INPUT_TYPE_MAP.get(field_type, "text")}" id="{name}" name="{name}" {required}>
+            </div>'''
+
+# Field type -> form snippet renderer; anything else renders as a basic <input>
+_FIELD_INPUT_RENDERERS: Dict[str, Callable[[str, str, str, str], str]] = {
+    "text": _textarea_input,
+    "boolean": _checkbox_input,
+}
+
+@lru_cache(maxsize=64)
+def render_index_html(fields: Tuple[Tuple[str, str, str, bool], ...]) -> str:
+    """Render the CRUD index page for (name, label, type, required) field tuples."""
+    field_inputs = [
+        _FIELD_INPUT_RENDERERS.get(field_type, _basic_input)(
+            name, label, field_type, "required" if is_required else ""
+        )
+        for name, label, field_type, is_required in fields
+        if name != "id"
+    ]
+
+    return INDEX_TPL.substitute(
+        form_fields="\n".join(field_inputs),
+        table_headers="\n                ".join(f'<th>{label}</th>' for _, label, _, _ in fields),
+        table_cells="\n                    ".join(f'<td>{{{{ item.{name} }}}}</td>' for name, _, _, _ in fields)
+    )
+
+def check_raw_fields(raw_fields: Any) -> None:
+    """Reject LLM field output that FieldDefinition would not accept."""
+    if not isinstance(raw_fields, list):
+        raise ValueError("LLM response 'fields' is not a list")
+    for f in raw_fields:
+        if not (
+            isinstance(f, dict)
+            and isinstance(f.get("name"), str)
+            and isinstance(f.get("label"), str)
+            and isinstance(f.get("type"), str)
+            and isinstance(f.get("required", False), bool)
+            and isinstance(f.get("defaultValue"), (str, int, float, type(None)))
+        ):
+            raise ValueError(f"Malformed field in LLM response: {f!r}")
+
+def default_value(value: Any) -> Optional[str]:
+    """Coerce a scalar LLM default (e.g. 0 or true) to the string FieldDefinition expects."""
+    if value is None or isinstance(value, str):
+        return value
+    return orjson.dumps(value).decode()
+
+def build_fields(raw_fields: List[dict]) -> List[FieldDefinition]:
+    """Build field models from parsed LLM output without re-running validation."""
+    # model_construct trusts its input, so reject malformed LLM output up front
+    check_raw_fields(raw_fields)
+    return [
+        FieldDefinition.model_construct(
+            id=str(i),
+            name=f["name"],
+            label=f["label"],
+            type=f["type"],
+            required=f.get("required", False),
+            defaultValue=default_value(f.get("defaultValue"))
+        )
+        for i, f in enumerate(raw_fields)
+    ]
+
+@lru_cache(maxsize=1)
+def get_litellm():
+    """Import LiteLLM on first use; it is slow to import and most endpoints never call it."""
+    import litellm
+    litellm.aclient_session = getattr(app.state, "http_client", None)
+    return litellm
+
+async def stream_model(
+    model: str,
+    prompt: str,
+    temperature: float = 0.4,
+    max_tokens: int = 2048,
+    literals: Optional[Dict[str, str]] = None,
+    validate: Optional[Callable[[str], Any]] = None
+) -> AsyncIterator[str]:
+    """Yield LLM output as it arrives; a cache hit yields the whole response at once.
+    
+    The prompt may contain placeholders from literals (e.g. ENTITY_PLACEHOLDER).
+    The cache is keyed on the placeholder form so structurally identical
+    prompts share one entry; the LLM sees the substituted values.
+    A response is only cached if it was not cut off at max_tokens and
+    validate (when given) accepts the cleaned text without raising.
+    """
     kwargs = {
         "model": model,
         "messages": [
-            {"role": "system", "content": "You are an expert database and application architect. Return structured, valid responses."},
-            {"role": "user", "content": prompt},
+            _SYSTEM_MSG,
+            {"role": "user", "content": specialize(prompt, literals)},
         ],
+        "stream": True,
+        "num_retries": 2,
     }
     
-    if not model.lower().startswith("gpt-5"):
-        kwargs["temperature"] = temperature
+    # Reasoning models reject temperature and spend hidden tokens against the cap
+    skip = unsupported_params(model)
+    tuning = {"temperature": temperature, "max_tokens": max_tokens}
+    kwargs.update({k: v for k, v in tuning.items() if k not in skip})
+    
+    key = None
+    if LLM_CACHE_ENABLED:
+        messages = [_SYSTEM_MSG, {"role": "user", "content": prompt}]
+        key = cache_key(model, messages, kwargs.get("temperature"))
+        try:
+            cached = await run_in_threadpool(llm_cache.get, key)
+        except sqlite3.Error as e:
+            logger.warning("LLM cache lookup failed: %s", e)
+            cached = None
+        if cached is not None:
+            llm_cache_status.set("HIT")
+            yield specialize(cached, literals)
+            return
+    llm_cache_status.set("MISS")
+    
+    # The first import takes seconds (it loads the model cost map); keep it off the loop
+    litellm = await run_in_threadpool(get_litellm)
+    parts = []
+    finish_reason = None
+    async with _LLM_SEM:
+        try:
+            response = await litellm.acompletion(**kwargs)
+        except (TypeError, litellm.UnsupportedParamsError) as e:
+            # Only retry when the error names a sampling param we sent; an
+            # unrelated TypeError is a bug and must surface
+            rejected = [k for k in _TUNING_PARAMS if k in kwargs and k in str(e)]
+            if not rejected and isinstance(e, litellm.UnsupportedParamsError):
+                rejected = [k for k in _TUNING_PARAMS if k in kwargs]
+            if not rejected:
+                raise
+            logger.warning("Model %s rejected %s; retrying without them", model, ", ".join(rejected))
+            _MODEL_UNSUPPORTED.setdefault(model, set()).update(rejected)
+            for k in rejected:
+                del kwargs[k]
+            if key is not None:
+                key = cache_key(model, messages, kwargs.get("temperature"))
+            response = await litellm.acompletion(**kwargs)
+        async for chunk in response:
+            choice = chunk.choices[0]
+            finish_reason = getattr(choice, "finish_reason", None) or finish_reason
+            delta = choice.delta.content or ""
+            parts.append(delta)
+            yield delta
     
+    if key is None:
+        return
+    content = clean_code("".join(parts))
+    if finish_reason == "length":
+        logger.warning("Not caching response from %s truncated at max_tokens", model)
+        return
+    if validate is not None:
+        try:
+            validate(content)
+        except Exception:
+            logger.info("Not caching unusable response from %s", model)
+            return
+    # The response is already delivered; a busy or failing cache must not turn it into an error
     try:
-        response = completion(**kwargs)
-    except TypeError:
-        if "temperature" in kwargs:
-            del kwargs["temperature"]
-        response = completion(**kwargs)
+        await run_in_threadpool(llm_cache.set, key, generalize(content, literals))
+    except sqlite3.Error as e:
+        logger.warning("LLM cache write failed: %s", e)
+
+async def ask_model(
+    model: str,
+    prompt: str,
+    temperature: float = 0.4,
+    max_tokens: int = 2048,
+    literals: Optional[Dict[str, str]] = None,
+    validate: Optional[Callable[[str], Any]] = None
+) -> str:
+    """Call LLM via LiteLLM without blocking the event loop and return the cleaned response."""
+    parts = [
+        delta async for delta in stream_model(model, prompt, temperature, max_tokens, literals, validate)
+    ]
+    return clean_code("".join(parts))
+
+# Prompt instructions are static and sent first so providers can cache the
+# shared prefix; per-request data always follows as a delimited tail
+SCHEMA_INSTRUCTIONS = """Analyze the application description below and identify the main entity, its fields, and data types.
+
+Return a JSON object with:
+- entityName: string (singular, PascalCase)
+- fields: array of objects with name (snake_case), label (Title Case), type (string/number/boolean/date/email/text), required (boolean)
+
+Example:
+{
+  "entityName": "Book",
+  "fields": [
+    {"name": "title", "label": "Title", "type": "string", "required": true},
+    {"name": "author", "label": "Author", "type": "string", "required": true},
+    {"name": "publication_year", "label": "Publication Year", "type": "number", "required": false}
+  ]
+}
+
+Return ONLY valid JSON, no markdown or explanations."""
+
+REFINE_INSTRUCTIONS = """Modify the database schema below based on the user feedback.
+
+Return the updated schema as JSON with the same structure:
+{
+  "entityName": "...",
+  "fields": [...]
+}
+
+Apply the requested changes while maintaining data integrity.
+Return ONLY valid JSON, no markdown or explanations."""
+
+CODEGEN_INSTRUCTIONS = """Write valid Python 3.11 SQLAlchemy 2.0 code for the entity below.
+
+Requirements:
+- Use DeclarativeBase
+- Import: from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+- Import: from sqlalchemy import Integer, String, Text, Date, Boolean
+- Define class Base(DeclarativeBase)
+- Create a class named after the entity that inherits from Base, with __tablename__
+- Use mapped_column for all fields
+- Map types: string→String, number→Integer, boolean→Boolean, date→Date, text→Text
+
+Return ONLY the Python code, no markdown."""
+
+async def ask_schema_code(model: str, schema: SchemaDefinition) -> str:
+    """Have the LLM write schema.py (only used when USE_LLM_SCHEMA is set)."""
+    schema_prompt = (
+        f"{CODEGEN_INSTRUCTIONS}\n\n"
+        f"--- ENTITY ---\n"
+        f"Entity: {schema.entityName}\n"
+        f"Fields: {[(f.name, f.type, f.required) for f in schema.fields]}"
+    )
     
-    content = response["choices"][0]["message"]["content"].strip()
-    return clean_code(content)
+    schema_code = await ask_model(
+        model,
+        schema_prompt,
+        max_tokens=4096,
+        validate=lambda code: compile(code.replace('(Base())', '(Base)'), "schema.py", "exec")
+    )
+    return schema_code.replace('(Base())', '(Base)')
+
+def write_project_files(project_dir: Path, files: Dict[str, str]) -> Dict[str, str]:
+    """Create project_dir, write each relative path's content and return their SHA-256s."""
+    digests = {}
+    created = set()
+    for relative_path, content in files.items():
+        file_path = project_dir / relative_path
+        if file_path.parent not in created:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            created.add(file_path.parent)
+        data = content.encode()
+        file_path.write_bytes(data)
+        digests[relative_path] = hashlib.sha256(data).hexdigest()
+    return digests
+
+@lru_cache(maxsize=1024)
+def resolve_project_dir(project_id: str) -> Path:
+    """Validate a project id and return its resolved directory."""
+    if not _PROJECT_ID_RE.match(project_id):
+        raise HTTPException(status_code=400, detail="Invalid project id")
+    return Path(f"generated/{project_id}").resolve()
+
+def resolve_project_file(project_dir: Path, file_path: str) -> Path:
+    """Resolve file_path inside project_dir, rejecting anything that escapes it."""
+    relative = PurePosixPath(file_path)
+    if relative.is_absolute() or ".." in relative.parts:
+        raise HTTPException(status_code=400, detail="Invalid file path")
+    full_path = (project_dir / relative).resolve()
+    if not full_path.is_relative_to(project_dir):
+        raise HTTPException(status_code=400, detail="Invalid file path")
+    return full_path
+
+def iter_project_files(project_dir: Path):
+    """Yield a DirEntry for every file under project_dir, reusing cached dirent data."""
+    stack = [project_dir]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry
+
+def list_project_files(project_dir: Path) -> List[dict]:
+    """Describe every file under project_dir for the file browser."""
+    files = []
+    for entry in iter_project_files(project_dir):
+        suffix = os.path.splitext(entry.name)[1]
+        files.append({
+            "name": entry.name,
+            "path": os.path.relpath(entry.path, project_dir),
+            "type": suffix[1:] if suffix else "file",
+            "size": entry.stat().st_size
+        })
+    return files
+
+class ZipChunkBuffer:
+    """Write-only sink that collects ZIP output until it is drained."""
+
+    def __init__(self):
+        self.data = bytearray()
+
+    def write(self, chunk: bytes) -> int:
+        self.data += chunk
+        return len(chunk)
+
+    def flush(self):
+        pass
+
+    def drain(self) -> bytes:
+        chunk = bytes(self.data)
+        self.data.clear()
+        return chunk
+
+def iter_zip(project_dir: Path):
+    """Yield a ZIP archive of project_dir one file at a time."""
+    buffer = ZipChunkBuffer()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for entry in iter_project_files(project_dir):
+            archive.write(entry.path, os.path.relpath(entry.path, project_dir))
+            yield buffer.drain()
+    yield buffer.drain()
 
 # API Endpoints
+def parse_llm_json(content: str, error: str) -> dict:
+    """Parse an LLM response as JSON, falling back to the first embedded object."""
+    try:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError:
+        json_text = extract_json_object(content)
+        if json_text:
+            return orjson.loads(json_text)
+        raise ValueError(error)
+
+def build_schema_prompt(request: GenerateSchemaRequest) -> Tuple[str, Optional[Dict[str, str]]]:
+    """Build the schema-analysis prompt and its literals."""
+    literals = entity_literals(request.entityName)
+    prompt = (
+        f"{SCHEMA_INSTRUCTIONS}\n\n"
+        f"--- USER INPUT ---\n"
+        f"User description: {generalize(request.prompt, literals)}\n"
+        f"Entity name hint: {ENTITY_PLACEHOLDER if literals else request.entityName or 'auto-detect'}"
+    )
+    return prompt, literals
+
+def parse_generated_schema(content: str, request: GenerateSchemaRequest) -> SchemaDefinition:
+    """Turn the schema-analysis response into a SchemaDefinition with an id field."""
+    schema_data = parse_llm_json(content, "Could not parse schema from LLM response")
+    
+    fields = schema_data.get("fields", [])
+    check_raw_fields(fields)
+    names = {f["name"] for f in fields}
+    if "id" not in names:
+        fields.insert(0, {
+            "name": "id",
+            "label": "ID",
+            "type": "number",
+            "required": True
+        })
+    
+    return SchemaDefinition.model_construct(
+        entityName=schema_data.get("entityName", request.entityName or "Entity"),
+        fields=build_fields(fields),
+        operations=dict.fromkeys(request.operations, True)
+    )
+
+def build_refine_prompt(request: RefineSchemaRequest) -> Tuple[str, Optional[Dict[str, str]]]:
+    """Build the schema-refinement prompt and its literals."""
+    current_fields = request.currentSchema.model_dump(
+        include={"fields": {"__all__": {"name", "label", "type", "required", "defaultValue"}}}
+    )["fields"]
+    
+    literals = entity_literals(request.currentSchema.entityName)
+    prompt = (
+        f"{REFINE_INSTRUCTIONS}\n\n"
+        f"--- CURRENT SCHEMA ---\n"
+        f"Entity: {ENTITY_PLACEHOLDER if literals else request.currentSchema.entityName}\n"
+        f"Fields: {orjson.dumps(current_fields, option=orjson.OPT_INDENT_2).decode()}\n\n"
+        f"--- USER FEEDBACK ---\n"
+        f"{generalize(request.feedback, literals)}"
+    )
+    return prompt, literals
+
+def parse_refined_schema(content: str, request: RefineSchemaRequest) -> SchemaDefinition:
+    """Turn the refinement response into a SchemaDefinition."""
+    schema_data = parse_llm_json(content, "Could not parse refined schema")
+    return SchemaDefinition.model_construct(
+        entityName=schema_data.get("entityName", request.currentSchema.entityName),
+        fields=build_fields(schema_data["fields"]),
+        operations=request.currentSchema.operations
+    )
+
+async def stream_schema_events(
+    model: str,
+    prompt: str,
+    literals: Optional[Dict[str, str]],
+    parse: Callable[[str], SchemaDefinition],
+    action: str
+) -> AsyncIterator[bytes]:
+    """Yield NDJSON events: each field as the LLM completes it, then the final schema."""
+    scanner = JsonItemScanner()
+    parts = []
+    try:
+        async for delta in stream_model(model, prompt, max_tokens=1024, literals=literals, validate=parse):
+            parts.append(delta)
+            for item in scanner.feed(delta):
+                try:
+                    field = orjson.loads(item)
+                except orjson.JSONDecodeError:
+                    continue
+                yield orjson.dumps({"type": "field", "field": field}) + b"\n"
+        schema = parse(clean_code("".join(parts)))
+        yield orjson.dumps({"type": "schema", "schema": schema.model_dump()}) + b"\n"
+    except Exception as e:
+        logger.exception("Error streaming %s", action)
+        yield orjson.dumps({"type": "error", "detail": error_detail(f"Failed to {action}", e)}) + b"\n"
+
 @app.post("/api/generate-schema", response_model=SchemaDefinition)
-async def generate_schema(request: GenerateSchemaRequest):
+async def generate_schema(request: GenerateSchemaRequest, response: Response):
     """Generate initial schema from user prompt."""
     try:
-        print(f"🧠 Generating schema for: {request.prompt}")
-        
-        analysis_prompt = f"""
-        Analyze this application description and identify the main entity, its fields, and data types.
-        
-        User description: {request.prompt}
-        Entity name hint: {request.entityName or 'auto-detect'}
-        
-        Return a JSON object with:
-        - entityName: string (singular, PascalCase)
-        - fields: array of objects with name (snake_case), label (Title Case), type (string/number/boolean/date/email/text), required (boolean)
-        
-        Example:
-        {{
-          "entityName": "Book",
-          "fields": [
-            {{"name": "title", "label": "Title", "type": "string", "required": true}},
-            {{"name": "author", "label": "Author", "type": "string", "required": true}},
-            {{"name": "publication_year", "label": "Publication Year", "type": "number", "required": false}}
-          ]
-        }}
-        
-        Return ONLY valid JSON, no markdown or explanations.
-        """
-        
-        response = ask_model(request.model, analysis_prompt)
-        
-        import json
-        try:
-            schema_data = json.loads(response)
-        except json.JSONDecodeError:
-            json_match = re.search(r'\{.*\}', response, re.DOTALL)
-            if json_match:
-                schema_data = json.loads(json_match.group())
-            else:
-                raise ValueError("Could not parse schema from LLM response")
-        
-        fields = schema_data.get("fields", [])
-        if not any(f["name"] == "id" for f in fields):
-            fields.insert(0, {
-                "name": "id",
-                "label": "ID",
-                "type": "number",
-                "required": True
-            })
-        
-        schema = SchemaDefinition(
-            entityName=schema_data.get("entityName", request.entityName or "Entity"),
-            fields=[
-                FieldDefinition(
-                    id=str(i),
-                    name=f["name"],
-                    label=f["label"],
-                    type=f["type"],
-                    required=f.get("required", False),
-                    defaultValue=f.get("defaultValue")
-                )
-                for i, f in enumerate(fields)
-            ],
-            operations={op: True for op in request.operations}
+        logger.info("Generating schema for: %s", request.prompt)
+        
+        analysis_prompt, literals = build_schema_prompt(request)
+        content = await ask_model(
+            request.model,
+            analysis_prompt,
+            max_tokens=1024,
+            literals=literals,
+            validate=lambda content: parse_generated_schema(content, request)
         )
+        response.headers["X-Cache"] = llm_cache_status.get()
         
-        print(f"✅ Generated schema for {schema.entityName} with {len(schema.fields)} fields")
+        schema = parse_generated_schema(content, request)
+        logger.info("Generated schema for %s with %d fields", schema.entityName, len(schema.fields))
         return schema
         
     except Exception as e:
-        print(f"❌ Error generating schema: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to generate schema: {str(e)}")
+        logger.exception("Error generating schema")
+        raise HTTPException(status_code=500, detail=error_detail("Failed to generate schema", e))
+
+@app.post("/api/generate-schema/stream")
+async def generate_schema_stream(request: GenerateSchemaRequest):
+    """Stream schema generation as NDJSON field events followed by the full schema."""
+    logger.info("Streaming schema for: %s", request.prompt)
+    analysis_prompt, literals = build_schema_prompt(request)
+    return StreamingResponse(
+        stream_schema_events(
+            request.model,
+            analysis_prompt,
+            literals,
+            lambda content: parse_generated_schema(content, request),
+            "generate schema"
+        ),
+        media_type="application/x-ndjson"
+    )
 
 @app.post("/api/refine-schema", response_model=SchemaDefinition)
-async def refine_schema(request: RefineSchemaRequest):
+async def refine_schema(request: RefineSchemaRequest, response: Response):
     """Refine existing schema based on user feedback."""
     try:
-        print(f"🔄 Refining schema with feedback: {request.feedback}")
-        
-        current_fields = [
-            {
-                "name": f.name,
-                "label": f.label,
-                "type": f.type,
-                "required": f.required,
-                "defaultValue": f.defaultValue
-            }
-            for f in request.currentSchema.fields
-        ]
-        
-        refine_prompt = f"""
-        Modify this database schema based on user feedback.
-        
-        Current schema:
-        Entity: {request.currentSchema.entityName}
-        Fields: {json.dumps(current_fields, indent=2)}
-        
-        User feedback: {request.feedback}
-        
-        Return the updated schema as JSON with the same structure:
-        {{
-          "entityName": "...",
-          "fields": [...]
-        }}
-        
-        Apply the requested changes while maintaining data integrity.
-        Return ONLY valid JSON, no markdown or explanations.
-        """
-        
-        response = ask_model(request.model, refine_prompt)
-        
-        import json
-        try:
-            schema_data = json.loads(response)
-        except json.JSONDecodeError:
-            json_match = re.search(r'\{.*\}', response, re.DOTALL)
-            if json_match:
-                schema_data = json.loads(json_match.group())
-            else:
-                raise ValueError("Could not parse refined schema")
-        
-        refined_schema = SchemaDefinition(
-            entityName=schema_data.get("entityName", request.currentSchema.entityName),
-            fields=[
-                FieldDefinition(
-                    id=str(i),
-                    name=f["name"],
-                    label=f["label"],
-                    type=f["type"],
-                    required=f.get("required", False),
-                    defaultValue=f.get("defaultValue")
-                )
-                for i, f in enumerate(schema_data["fields"])
-            ],
-            operations=request.currentSchema.operations
+        logger.info("Refining schema with feedback: %s", request.feedback)
+        
+        refine_prompt, literals = build_refine_prompt(request)
+        content = await ask_model(
+            request.model,
+            refine_prompt,
+            max_tokens=1024,
+            literals=literals,
+            validate=lambda content: parse_refined_schema(content, request)
         )
+        response.headers["X-Cache"] = llm_cache_status.get()
         
-        print(f"✅ Refined schema for {refined_schema.entityName}")
+        refined_schema = parse_refined_schema(content, request)
+        logger.info("Refined schema for %s", refined_schema.entityName)
         return refined_schema
         
     except Exception as e:
-        print(f"❌ Error refining schema: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to refine schema: {str(e)}")
+        logger.exception("Error refining schema")
+        raise HTTPException(status_code=500, detail=error_detail("Failed to refine schema", e))
+
+@app.post("/api/refine-schema/stream")
+async def refine_schema_stream(request: RefineSchemaRequest):
+    """Stream schema refinement as NDJSON field events followed by the full schema."""
+    logger.info("Streaming refinement with feedback: %s", request.feedback)
+    refine_prompt, literals = build_refine_prompt(request)
+    return StreamingResponse(
+        stream_schema_events(
+            request.model,
+            refine_prompt,
+            literals,
+            lambda content: parse_refined_schema(content, request),
+            "refine schema"
+        ),
+        media_type="application/x-ndjson"
+    )
+
+async def build_app(
+    request: GenerateAppRequest,
+    project_id: str,
+    on_progress: Optional[Callable[[str], None]] = None
+) -> ValidationResult:
+    """Render, write and register all files for a generated project.
+    
+    on_progress is called in the threadpool with a short label at each milestone.
+    """
+    project_dir = GENERATED_DIR / project_id
+    files = {"__init__.py": ""}
+    
+    # Generate API code with proper imports
+    entity_lower = pascal_to_snake(request.schema.entityName)
+    
+    # Single pass over the fields for the form parameters, assignments and page layout
+    form_fields = []
+    assignments = []
+    layout = []
+    for field in request.schema.fields:
+        layout.append((field.name, field.label, field.type, field.required))
+        if field.name == "id":  # Skip ID field
+            continue
+        form_fields.append(f"{field.name}: {_PY_TYPE_MAP.get(field.type, 'str')} = Form(...)")
+        assignments.append(f'{field.name}={field.name},')
+    
+    form_params = ", ".join(form_fields)
+    field_assignments = "\n    ".join(assignments)
+    
+    api_code = API_TPL.substitute(
+        entity=request.schema.entityName,
+        entity_lower=entity_lower,
+        form_params=form_params,
+        field_assignments=field_assignments
+    )
+    
+    files["api.py"] = api_code
+    
+    # Generate frontend.py with working interface
+    frontend_code = FRONTEND_TPL.substitute(entity=request.schema.entityName)
+    files["frontend.py"] = frontend_code
+    
+    # Generate index.html template with full CRUD interface
+    template_html = render_index_html(tuple(layout))
+    files["templates/index.html"] = template_html
+    
+    # Generate requirements.txt
+    requirements = REQUIREMENTS_TPL.substitute()
+    files["requirements.txt"] = requirements
+    
+    # Generate README
+    readme = README_TPL.substitute(entity=request.schema.entityName)
+    files["README.md"] = readme
+    
+    if on_progress:
+        await run_in_threadpool(on_progress, "writing files")
+    if USE_LLM_SCHEMA:
+        # Write the deterministic scaffolding while the LLM writes schema.py
+        schema_code, digests = await asyncio.gather(
+            ask_schema_code(request.model, request.schema),
+            run_in_threadpool(write_project_files, project_dir, files)
+        )
+        digests.update(await run_in_threadpool(write_project_files, project_dir, {"schema.py": schema_code}))
+    else:
+        schema_code = render_sqlalchemy_model(request.schema)
+        files["schema.py"] = schema_code
+        digests = await run_in_threadpool(write_project_files, project_dir, files)
+    
+    # Save project to database
+    if on_progress:
+        await run_in_threadpool(on_progress, "saving project")
+    await run_in_threadpool(save_project, project_id, request.schema.model_dump(), "completed", digests)
+    
+    # Previews come from the rendered content; no need to read the files back
+    schema_preview = schema_code[:500]
+    api_preview = api_code[:500]
+    
+    warnings = []
+    if len(request.schema.fields) > 10:
+        warnings.append("Large number of fields may impact performance")
+    
+    result = ValidationResult(
+        success=True,
+        errors=[],
+        warnings=warnings,
+        generatedFiles={
+            "schema": f"generated/{project_id}/schema.py",
+            "api": f"generated/{project_id}/api.py",
+            "frontend": f"generated/{project_id}/frontend.py",
+            "templates": f"generated/{project_id}/templates/index.html",
+            "requirements": f"generated/{project_id}/requirements.txt",
+            "readme": f"generated/{project_id}/README.md"
+        },
+        codePreview={
+            "schema": schema_preview,
+            "api": api_preview
+        },
+        projectId=project_id
+    )
+    return result
 
 @app.post("/api/generate-app", response_model=ValidationResult)
 async def generate_app(request: GenerateAppRequest):
     """Generate complete application code from schema."""
     try:
         # Generate unique project ID
-        project_id = str(uuid.uuid4())[:8]
-        print(f"🚀 Generating application {project_id} for {request.schema.entityName}")
-        
-        # Create project directory
-        project_dir = Path(f"generated/{project_id}")
-        project_dir.mkdir(parents=True, exist_ok=True)
-        (project_dir / "__init__.py").touch(exist_ok=True)
-        (project_dir / "templates").mkdir(exist_ok=True)
-        
-        # Generate schema.py
-        schema_prompt = f"""
-        Write valid Python 3.11 SQLAlchemy 2.0 code for this entity:
-        
-        Entity: {request.schema.entityName}
-        Fields: {[(f.name, f.type, f.required) for f in request.schema.fields]}
-        
-        Requirements:
-        - Use DeclarativeBase
-        - Import: from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
-        - Import: from sqlalchemy import Integer, String, Text, DateTime, Boolean
-        - Define class Base(DeclarativeBase)
-        - Create class {request.schema.entityName}(Base) with __tablename__
-        - Use mapped_column for all fields
-        - Map types: string→String, number→Integer, boolean→Boolean, date→DateTime, text→Text
+        project_id = await run_in_threadpool(new_project_id)
+        logger.info("Generating application %s for %s", project_id, request.schema.entityName)
         
-        Return ONLY the Python code, no markdown.
-        """
-        
-        schema_code = ask_model(request.model, schema_prompt)
-        schema_code = schema_code.replace('(Base())', '(Base)')
-        (project_dir / "schema.py").write_text(schema_code)
-        
-        # Generate API code with proper imports
-        entity_lower = re.sub(r'(?<!^)(?=[A-Z])', '_', request.schema.entityName).lower()
-        
-        # Create form fields for POST endpoint
-        form_fields = []
-        for field in request.schema.fields:
-            if field.name != "id":  # Skip ID field
-                field_type = "str" if field.type in ["string", "email", "text"] else "int" if field.type == "number" else "bool"
-                form_fields.append(f"{field.name}: {field_type} = Form(...)")
-        
-        form_params = ", ".join(form_fields)
-        field_assignments = "\n    ".join([f'{field.name}={field.name},' for field in request.schema.fields if field.name != "id"])
+        result = await build_app(request, project_id)
+        logger.info("Application %s generated successfully", project_id)
+        return result
         
-        api_code = f"""from fastapi import FastAPI, HTTPException, Form, Depends
-from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy import create_engine
-from pydantic import BaseModel
-from typing import List, Optional
-import schema
-
-SQLALCHEMY_DATABASE_URL = "sqlite:///./app.db"
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={{"check_same_thread": False}})
-SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
-
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-app = FastAPI(title="{request.schema.entityName} API")
-
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Create tables
-schema.Base.metadata.create_all(bind=engine)
-
-@app.get("/")
-async def root():
-    return {{"message": "Welcome to {request.schema.entityName} API", "endpoints": ["GET /{entity_lower}/", "POST /{entity_lower}/", "DELETE /{entity_lower}/{{id}}"]}}
-
-@app.post("/{entity_lower}/")
-async def create_{entity_lower}({form_params}, db: Session = Depends(get_db)):
-    try:
-        new_item = schema.{request.schema.entityName}(
-            {field_assignments}
-        )
-        db.add(new_item)
-        db.commit()
-        db.refresh(new_item)
-        return {{"message": "Created successfully", "id": new_item.id}}
     except Exception as e:
-        db.rollback()
-        raise HTTPException(status_code=400, detail=str(e))
-
-@app.get("/{entity_lower}/")
-async def read_{entity_lower}s(db: Session = Depends(get_db)):
-    items = db.query(schema.{request.schema.entityName}).all()
-    return {{"count": len(items), "items": items}}
-
-@app.get("/{entity_lower}/{{item_id}}")
-async def read_{entity_lower}(item_id: int, db: Session = Depends(get_db)):
-    item = db.query(schema.{request.schema.entityName}).filter(schema.{request.schema.entityName}.id == item_id).first()
-    if not item:
-        raise HTTPException(status_code=404, detail="Item not found")
-    return item
-
-@app.delete("/{entity_lower}/{{item_id}}")
-async def delete_{entity_lower}(item_id: int, db: Session = Depends(get_db)):
-    item = db.query(schema.{request.schema.entityName}).filter(schema.{request.schema.entityName}.id == item_id).first()
-    if not item:
-        raise HTTPException(status_code=404, detail="Item not found")
-    db.delete(item)
-    db.commit()
-    return {{"message": "Deleted successfully", "id": item_id}}
+        logger.exception("Error generating app")
+        raise HTTPException(status_code=500, detail=error_detail("Failed to generate app", e))
 
-if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
-"""
-        
-        (project_dir / "api.py").write_text(api_code)
-        
-        # Generate frontend.py with working interface
-        frontend_code = f"""from fastapi import FastAPI, Request, Form, HTTPException
-from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
-from fastapi.staticfiles import StaticFiles
-from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy import create_engine
-from pathlib import Path
-import schema
-
-app = FastAPI(title="{request.schema.entityName} Frontend")
-templates = Jinja2Templates(directory=str(Path(__file__).parent / "templates"))
-
-# Database setup
-SQLALCHEMY_DATABASE_URL = "sqlite:///./app.db"
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={{"check_same_thread": False}})
-SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
-
-def get_db():
-    db = SessionLocal()
-    try:
-        return db
-    finally:
-        db.close()
-
-@app.get("/", response_class=HTMLResponse)
-async def home(request: Request):
-    db = get_db()
-    items = db.query(schema.{request.schema.entityName}).all()
-    return templates.TemplateResponse("index.html", {{
-        "request": request, 
-        "title": "{request.schema.entityName}",
-        "items": items
-    }})
-
-@app.post("/create")
-async def create_item(request: Request):
-    db = get_db()
-    form_data = await request.form()
-    
+async def run_generate_app_job(job_id: str, request: GenerateAppRequest):
+    """Run a queued generate-app job, recording progress in the jobs table."""
     try:
-        new_item = schema.{request.schema.entityName}(
-            **{{k: v for k, v in form_data.items() if k != "id"}}
+        await run_in_threadpool(update_job, job_id, "running", "allocating project")
+        project_id = await run_in_threadpool(new_project_id)
+        logger.info("Job %s generating application %s for %s", job_id, project_id, request.schema.entityName)
+        
+        result = await build_app(
+            request,
+            project_id,
+            on_progress=lambda step: update_job(job_id, "running", step)
         )
-        db.add(new_item)
-        db.commit()
-        return RedirectResponse(url="/", status_code=303)
-    except Exception as e:
-        return templates.TemplateResponse("index.html", {{
-            "request": request,
-            "title": "{request.schema.entityName}",
-            "error": str(e),
-            "items": db.query(schema.{request.schema.entityName}).all()
-        }})
-
-@app.post("/delete/{{item_id}}")
-async def delete_item(item_id: int):
-    db = get_db()
-    item = db.query(schema.{request.schema.entityName}).filter(schema.{request.schema.entityName}.id == item_id).first()
-    if item:
-        db.delete(item)
-        db.commit()
-    return RedirectResponse(url="/", status_code=303)
-
-if __name__ == "__main__":
-    import uvicorn
-    schema.Base.metadata.create_all(bind=engine)
-    uvicorn.run(app, host="0.0.0.0", port=8001)
-"""
-        (project_dir / "frontend.py").write_text(frontend_code)
+        await run_in_threadpool(update_job, job_id, "completed", "done", result.model_dump())
+        logger.info("Job %s completed application %s", job_id, project_id)
         
-        # Generate index.html template with full CRUD interface
-        field_inputs = []
-        for field in request.schema.fields:
-            if field.name != "id":
-                input_type = "text"
-                if field.type == "number":
-                    input_type = "number"
-                elif field.type == "email":
-                    input_type = "email"
-                elif field.type == "date":
-                    input_type = "date"
-                elif field.type == "boolean":
-                    input_type = "checkbox"
-                
-                required = "required" if field.required else ""
-                
-                if field.type == "text":
-                    field_inputs.append(f'''
-            <div class="form-group">
-                <label for="{field.name}">{field.label}:</label>
-                <textarea id="{field.name}" name="{field.name}" rows="3" {required}></textarea>
-            </div>''')
-                elif field.type == "boolean":
-                    field_inputs.append(f'''
-            <div class="form-group checkbox">
-                <label>
-                    <input type="checkbox" id="{field.name}" name="{field.name}" value="true">
-                    {field.label}
-                </label>
-            </div>''')
-                else:
-                    field_inputs.append(f'''
-            <div class="form-group">
-                <label for="{field.name}">{field.label}:</label>
-                <input type="{input_type}" id="{field.name}" name="{field.name}" {required}>
-            </div>''')
-        
-        form_fields = "\n".join(field_inputs)
-        
-        table_headers = "\n                ".join([f'<th>{field.label}</th>' for field in request.schema.fields])
-        table_cells = "\n                    ".join([f'<td>{{{{ item.{field.name} }}}}</td>' for field in request.schema.fields])
-        
-        template_html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{{{{ title }}}} Manager</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-        }}
-        
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-        }}
-        
-        .header {{
-            background: white;
-            padding: 30px;
-            border-radius: 10px;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-            margin-bottom: 30px;
-        }}
-        
-        h1 {{
-            color: #333;
-            font-size: 2rem;
-            margin-bottom: 10px;
-        }}
-        
-        .subtitle {{
-            color: #666;
-            font-size: 1rem;
-        }}
-        
-        .card {{
-            background: white;
-            padding: 30px;
-            border-radius: 10px;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-            margin-bottom: 30px;
-        }}
-        
-        h2 {{
-            color: #333;
-            margin-bottom: 20px;
-            font-size: 1.5rem;
-            border-bottom: 2px solid #667eea;
-            padding-bottom: 10px;
-        }}
-        
-        .form-group {{
-            margin-bottom: 20px;
-        }}
-        
-        label {{
-            display: block;
-            margin-bottom: 5px;
-            color: #333;
-            font-weight: 500;
-        }}
-        
-        input[type="text"],
-        input[type="number"],
-        input[type="email"],
-        input[type="date"],
-        textarea {{
-            width: 100%;
-            padding: 10px;
-            border: 2px solid #e0e0e0;
-            border-radius: 5px;
-            font-size: 1rem;
-            transition: border-color 0.3s;
-        }}
-        
-        input:focus,
-        textarea:focus {{
-            outline: none;
-            border-color: #667eea;
-        }}
-        
-        .checkbox {{
-            display: flex;
-            align-items: center;
-        }}
-        
-        .checkbox label {{
-            display: flex;
-            align-items: center;
-            margin-bottom: 0;
-        }}
-        
-        .checkbox input {{
-            width: auto;
-            margin-right: 10px;
-        }}
-        
-        button {{
-            background: #667eea;
-            color: white;
-            padding: 12px 30px;
-            border: none;
-            border-radius: 5px;
-            font-size: 1rem;
-            cursor: pointer;
-            transition: background 0.3s;
-        }}
-        
-        button:hover {{
-            background: #5568d3;
-        }}
-        
-        .btn-delete {{
-            background: #ef4444;
-            padding: 8px 16px;
-            font-size: 0.875rem;
-        }}
-        
-        .btn-delete:hover {{
-            background: #dc2626;
-        }}
-        
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin-top: 20px;
-        }}
-        
-        th, td {{
-            padding: 12px;
-            text-align: left;
-            border-bottom: 1px solid #e0e0e0;
-        }}
-        
-        th {{
-            background: #f5f5f5;
-            font-weight: 600;
-            color: #333;
-        }}
-        
-        tr:hover {{
-            background: #f9f9f9;
-        }}
-        
-        .no-data {{
-            text-align: center;
-            padding: 40px;
-            color: #999;
-        }}
-        
-        .error {{
-            background: #fee;
-            border: 1px solid #fcc;
-            color: #c33;
-            padding: 15px;
-            border-radius: 5px;
-            margin-bottom: 20px;
-        }}
-        
-        .success {{
-            background: #efe;
-            border: 1px solid #cfc;
-            color: #3c3;
-            padding: 15px;
-            border-radius: 5px;
-            margin-bottom: 20px;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>{{{{ title }}}} Management System</h1>
-            <p class="subtitle">Create, read, and manage your {{{{ title }}}} records</p>
-        </div>
-        
-        {{% if error %}}
-        <div class="error">
-            <strong>Error:</strong> {{{{ error }}}}
-        </div>
-        {{% endif %}}
-        
-        <div class="card">
-            <h2>Create New {{{{ title }}}}</h2>
-            <form method="post" action="/create">
-                {form_fields}
-                
-                <button type="submit">Create {{{{ title }}}}</button>
-            </form>
-        </div>
-        
-        <div class="card">
-            <h2>All {{{{ title }}}}s</h2>
-            
-            {{% if items %}}
-            <table>
-                <thead>
-                    <tr>
-                        {table_headers}
-                        <th>Actions</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    {{% for item in items %}}
-                    <tr>
-                        {table_cells}
-                        <td>
-                            <form method="post" action="/delete/{{{{ item.id }}}}" style="display: inline;">
-                                <button type="submit" class="btn-delete" onclick="return confirm('Are you sure?')">Delete</button>
-                            </form>
-                        </td>
-                    </tr>
-                    {{% endfor %}}
-                </tbody>
-            </table>
-            {{% else %}}
-            <div class="no-data">
-                <p>No {{{{ title }}}}s found. Create your first one above!</p>
-            </div>
-            {{% endif %}}
-        </div>
-    </div>
-</body>
-</html>
-"""
-        (project_dir / "templates" / "index.html").write_text(template_html)
-        
-        # Generate requirements.txt
-        requirements = """fastapi==0.115.0
-uvicorn[standard]==0.32.0
-sqlalchemy==2.0.36
-jinja2==3.1.4
-python-multipart==0.0.9
-"""
-        (project_dir / "requirements.txt").write_text(requirements)
-        
-        # Generate README
-        readme = f"""# {request.schema.entityName} Application
-
-Generated by AI App Generator
-
-## Installation
-
-```bash
-pip install -r requirements.txt
-```
+    except Exception as e:
+        logger.exception("Error in generate-app job %s", job_id)
+        await run_in_threadpool(update_job, job_id, "failed", "failed", None, error_detail("Failed to generate app", e))
 
-## Run API Server
+@app.post("/api/jobs/generate-app", status_code=202)
+async def enqueue_generate_app(request: GenerateAppRequest, background_tasks: BackgroundTasks):
+    """Queue application generation and return a job id to poll."""
+    job_id = uuid.uuid4().hex
+    await run_in_threadpool(create_job, job_id)
+    background_tasks.add_task(run_generate_app_job, job_id, request)
+    return {"jobId": job_id, "status": "pending", "statusUrl": f"/api/jobs/{job_id}"}
 
-```bash
-uvicorn api:app --reload --port 8000
-```
+async def run_generate_app_batch(jobs: List[Tuple[str, GenerateAppRequest]]):
+    """Run queued generate-app jobs concurrently; each records its own outcome."""
+    await asyncio.gather(*(run_generate_app_job(job_id, request) for job_id, request in jobs))
 
-## Run Frontend
+@app.post("/api/jobs/generate-app/batch", status_code=202)
+async def enqueue_generate_app_batch(request: GenerateAppBatchRequest, background_tasks: BackgroundTasks):
+    """Queue several applications at once; they generate concurrently, one job each."""
+    jobs = [(uuid.uuid4().hex, app_request) for app_request in request.apps]
+    await run_in_threadpool(create_jobs, [job_id for job_id, _ in jobs])
+    background_tasks.add_task(run_generate_app_batch, jobs)
+    return {
+        "jobs": [
+            {"jobId": job_id, "status": "pending", "statusUrl": f"/api/jobs/{job_id}"}
+            for job_id, _ in jobs
+        ]
+    }
 
-```bash
-uvicorn frontend:app --reload --port 8001
-```
-
-Visit http://localhost:8001
-"""
-        (project_dir / "README.md").write_text(readme)
-        
-        # Save project to database
-        save_project(project_id, request.schema.dict())
-        
-        # Read generated files for preview
-        schema_preview = (project_dir / "schema.py").read_text()[:500]
-        api_preview = (project_dir / "api.py").read_text()[:500]
-        
-        warnings = []
-        if len(request.schema.fields) > 10:
-            warnings.append("Large number of fields may impact performance")
-        
-        result = ValidationResult(
-            success=True,
-            errors=[],
-            warnings=warnings,
-            generatedFiles={
-                "schema": f"generated/{project_id}/schema.py",
-                "api": f"generated/{project_id}/api.py",
-                "frontend": f"generated/{project_id}/frontend.py",
-                "templates": f"generated/{project_id}/templates/index.html",
-                "requirements": f"generated/{project_id}/requirements.txt",
-                "readme": f"generated/{project_id}/README.md"
-            },
-            codePreview={
-                "schema": schema_preview,
-                "api": api_preview
-            },
-            projectId=project_id
-        )
-        
-        print(f"✅ Application {project_id} generated successfully")
-        return result
-        
-    except Exception as e:
-        print(f"❌ Error generating app: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to generate app: {str(e)}")
+@app.get("/api/jobs/{job_id}")
+async def get_job_status(job_id: str):
+    """Get the status and, once completed, the result of a background job"""
+    job = await run_in_threadpool(get_job, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
 
 @app.get("/api/projects")
 async def list_projects():
     """List all generated projects"""
-    projects = load_projects_db()
-    return {"projects": list(projects.values())}
+    return {"projects": await run_in_threadpool(load_projects)}
 
 @app.get("/api/projects/{project_id}/files")
 async def get_project_files(project_id: str):
     """Get list of files in a project"""
-    project_dir = Path(f"generated/{project_id}")
+    project_dir = resolve_project_dir(project_id)
     if not project_dir.exists():
         raise HTTPException(status_code=404, detail="Project not found")
     
-    files = []
-    for file_path in project_dir.rglob("*"):
-        if file_path.is_file():
-            relative_path = file_path.relative_to(project_dir)
-            files.append({
-                "name": file_path.name,
-                "path": str(relative_path),
-                "type": file_path.suffix[1:] if file_path.suffix else "file",
-                "size": file_path.stat().st_size
-            })
-    
-    return files
+    return await run_in_threadpool(list_project_files, project_dir)
 
 @app.get("/api/projects/{project_id}/files/{file_path:path}")
-async def get_file_content(project_id: str, file_path: str):
+async def get_file_content(project_id: str, file_path: str, request: Request, format: Optional[str] = None):
     """Get content of a specific file"""
-    full_path = Path(f"generated/{project_id}/{file_path}")
-    if not full_path.exists():
+    project_dir = resolve_project_dir(project_id)
+    full_path = resolve_project_file(project_dir, file_path)
+    if not full_path.is_file():
         raise HTTPException(status_code=404, detail="File not found")
     
-    try:
-        content = full_path.read_text()
-        return {"content": content}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error reading file: {str(e)}")
+    if format == "json":
+        try:
+            content = await run_in_threadpool(full_path.read_text)
+            return {"content": content}
+        except Exception as e:
+            logger.exception("Error reading %s", full_path)
+            raise HTTPException(status_code=500, detail=error_detail("Error reading file", e))
+    
+    # Strong ETag from the manifest written at generation; older projects fall back to stat
+    digest = await run_in_threadpool(get_file_digest, project_id, full_path.relative_to(project_dir).as_posix())
+    stat = full_path.stat()
+    if digest:
+        etag = digest
+    else:
+        etag = f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+    # GZipMiddleware compresses files of at least GZIP_MINIMUM_SIZE bytes, and
+    # a strong ETag must differ between the gzip and identity representations
+    if stat.st_size >= GZIP_MINIMUM_SIZE and "gzip" in request.headers.get("accept-encoding", ""):
+        etag += "-gzip"
+    etag = f'"{etag}"' if digest else f'W/"{etag}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    
+    return FileResponse(full_path, media_type="text/plain", headers={"ETag": etag})
 
 @app.get("/api/projects/{project_id}/download")
-async def download_project(project_id: str):
+async def download_project(project_id: str, request: Request):
     """Download project as ZIP file"""
-    project_dir = Path(f"generated/{project_id}")
+    project_dir = resolve_project_dir(project_id)
     if not project_dir.exists():
         raise HTTPException(status_code=404, detail="Project not found")
     
-    try:
-        # Create ZIP file
-        zip_path = Path(f"generated/{project_id}.zip")
-        shutil.make_archive(str(zip_path.with_suffix('')), 'zip', project_dir)
-        
-        return FileResponse(
-            path=str(zip_path),
-            filename=f"{project_id}.zip",
-            media_type="application/zip"
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error creating ZIP: {str(e)}")
+    # Generated projects never change, so clients and CDNs may keep the archive
+    cache_headers = {
+        "ETag": f'"{project_id}"',
+        "Cache-Control": "public, max-age=31536000, immutable"
+    }
+    if request.headers.get("if-none-match") == cache_headers["ETag"]:
+        return Response(status_code=304, headers=cache_headers)
+    
+    # Build the ZIP while sending it, without a temporary file on disk
+    return StreamingResponse(
+        iter_zip(project_dir),
+        media_type="application/zip",
+        headers={
+            "Content-Disposition": f'attachment; filename="{project_id}.zip"',
+            **cache_headers
+        }
+    )
 
 @app.post("/api/projects/{project_id}/deploy")
 async def get_deploy_instructions(project_id: str):
     """Get deployment instructions for a project"""
-    projects = load_projects_db()
-    if project_id not in projects:
+    resolve_project_dir(project_id)
+    project = await run_in_threadpool(get_project, project_id)
+    if project is None:
         raise HTTPException(status_code=404, detail="Project not found")
     
-    project = projects[project_id]
     entity_name = project.get("entityName", "App")
     
     return {
@@ -893,8 +1332,23 @@ async def get_deploy_instructions(project_id: str):
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "service": "AI App Generator Orchestrator"}
+    return {
+        "status": "healthy",
+        "service": "AI App Generator Orchestrator",
+        "llmCache": llm_cache.stats()
+    }
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    workers = int(os.getenv("WORKERS", os.cpu_count() or 1))
+    uvicorn.run(
+        # Worker processes need an import string; a single process serves this
+        # module's app directly rather than importing it a second time
+        "orchestrator:app" if workers > 1 else app,
+        host="0.0.0.0",
+        port=8000,
+        # "auto" uses uvloop/httptools when installed and falls back elsewhere (e.g. Windows)
+        loop="auto",
+        http="auto",
+        workers=workers
+    )
\ No newline at end of file
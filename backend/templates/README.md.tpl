@@ -0,0 +1,23 @@
+# ${entity} Application
+
+Generated by AI App Generator
+
+## Installation
+
+```bash
+pip install -r requirements.txt
+```
+
+## Run API Server
+
+```bash
+uvicorn api:app --reload --port 8000
+```
+
+## Run Frontend
+
+```bash
+uvicorn frontend:app --reload --port 8001
+```
+
+Visit http://localhost:8001
@@ -0,0 +1,89 @@
+from fastapi import FastAPI, HTTPException, Form, Depends
+from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import create_engine, event
+from pydantic import BaseModel
+from typing import List, Optional
+from datetime import date
+import schema
+
+SQLALCHEMY_DATABASE_URL = "sqlite:///./app.db"
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    pool_pre_ping=True,
+    pool_size=20,
+    max_overflow=10,
+)
+
+@event.listens_for(engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+def get_db():
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+app = FastAPI(title="${entity} API")
+
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+# Create tables
+schema.Base.metadata.create_all(bind=engine)
+
+@app.get("/")
+async def root():
+    return {"message": "Welcome to ${entity} API", "endpoints": ["GET /${entity_lower}/", "POST /${entity_lower}/", "DELETE /${entity_lower}/{id}"]}
+
+@app.post("/${entity_lower}/")
+async def create_${entity_lower}(${form_params}, db: Session = Depends(get_db)):
+    try:
+        new_item = schema.${entity}(
+            ${field_assignments}
+        )
+        db.add(new_item)
+        db.commit()
+        db.refresh(new_item)
+        return {"message": "Created successfully", "id": new_item.id}
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=str(e))
+
+@app.get("/${entity_lower}/")
+async def read_${entity_lower}s(db: Session = Depends(get_db)):
+    items = db.query(schema.${entity}).all()
+    return {"count": len(items), "items": items}
+
+@app.get("/${entity_lower}/{item_id}")
+async def read_${entity_lower}(item_id: int, db: Session = Depends(get_db)):
+    item = db.query(schema.${entity}).filter(schema.${entity}.id == item_id).first()
+    if not item:
+        raise HTTPException(status_code=404, detail="Item not found")
+    return item
+
+@app.delete("/${entity_lower}/{item_id}")
+async def delete_${entity_lower}(item_id: int, db: Session = Depends(get_db)):
+    item = db.query(schema.${entity}).filter(schema.${entity}.id == item_id).first()
+    if not item:
+        raise HTTPException(status_code=404, detail="Item not found")
+    db.delete(item)
+    db.commit()
+    return {"message": "Deleted successfully", "id": item_id}
+
+if __name__ == "__main__":
+    import uvicorn
+    uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -0,0 +1,91 @@
+from fastapi import FastAPI, Request, Form, HTTPException, Depends
+from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.templating import Jinja2Templates
+from fastapi.staticfiles import StaticFiles
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import create_engine, event
+from pathlib import Path
+from datetime import date
+import schema
+
+app = FastAPI(title="${entity} Frontend")
+templates = Jinja2Templates(directory=str(Path(__file__).parent / "templates"))
+
+# Database setup
+SQLALCHEMY_DATABASE_URL = "sqlite:///./app.db"
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    pool_pre_ping=True,
+    pool_size=20,
+    max_overflow=10,
+)
+
+@event.listens_for(engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+def get_db():
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+@app.get("/", response_class=HTMLResponse)
+async def home(request: Request, db: Session = Depends(get_db)):
+    items = db.query(schema.${entity}).all()
+    return templates.TemplateResponse("index.html", {
+        "request": request, 
+        "title": "${entity}",
+        "items": items
+    })
+
+@app.post("/create")
+async def create_item(request: Request, db: Session = Depends(get_db)):
+    form_data = await request.form()
+    
+    try:
+        # Form values arrive as strings; convert them to each column's Python type
+        values = {}
+        for column in schema.${entity}.__table__.columns:
+            raw = form_data.get(column.name)
+            if column.name == "id" or raw is None or raw == "":
+                continue
+            py_type = column.type.python_type
+            if py_type is bool:
+                values[column.name] = raw == "true"
+            elif py_type is date:
+                values[column.name] = date.fromisoformat(raw)
+            else:
+                values[column.name] = py_type(raw)
+        new_item = schema.${entity}(**values)
+        db.add(new_item)
+        db.commit()
+        return RedirectResponse(url="/", status_code=303)
+    except Exception as e:
+        db.rollback()
+        return templates.TemplateResponse("index.html", {
+            "request": request,
+            "title": "${entity}",
+            "error": str(e),
+            "items": db.query(schema.${entity}).all()
+        })
+
+@app.post("/delete/{item_id}")
+async def delete_item(item_id: int, db: Session = Depends(get_db)):
+    item = db.query(schema.${entity}).filter(schema.${entity}.id == item_id).first()
+    if item:
+        db.delete(item)
+        db.commit()
+    return RedirectResponse(url="/", status_code=303)
+
+if __name__ == "__main__":
+    import uvicorn
+    schema.Base.metadata.create_all(bind=engine)
+    uvicorn.run(app, host="0.0.0.0", port=8001)
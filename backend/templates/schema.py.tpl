@@ -0,0 +1,15 @@
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import Integer, String, Text, Date, Boolean
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class ${entity}(Base):
+    __tablename__ = "${table_name}"
+
+${columns}
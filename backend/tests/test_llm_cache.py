@@ -0,0 +1,145 @@
+import asyncio
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+os.environ.setdefault("LITELLM_LOCAL_MODEL_COST_MAP", "True")
+os.environ["LLM_CACHE_ENABLED"] = "false"
+# orchestrator creates its databases and generated/ in the working directory
+os.chdir(tempfile.mkdtemp())
+
+import litellm  # noqa: E402
+import orchestrator  # noqa: E402
+from llm_cache import LLMCache, generalize, specialize  # noqa: E402
+
+def chunk(text, finish_reason=None):
+    delta = type("Delta", (), {"content": text})()
+    choice = type("Choice", (), {"delta": delta, "finish_reason": finish_reason})()
+    return type("Chunk", (), {"choices": [choice]})()
+
+class FakeModel:
+    """Stands in for litellm.acompletion and counts how often the LLM is reached."""
+
+    def __init__(self, output, finish_reason="stop"):
+        self.output = output
+        self.finish_reason = finish_reason
+        self.calls = 0
+
+    async def __call__(self, **kwargs):
+        self.calls += 1
+
+        async def stream():
+            yield chunk(self.output)
+            yield chunk("", self.finish_reason)
+        return stream()
+
+def parse_json(content):
+    return orchestrator.parse_llm_json(content, "Invalid JSON")
+
+class StreamModelCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = LLMCache(Path(self.tmp.name) / "llm_cache.db", ttl=3600)
+        self.saved = (litellm.acompletion, orchestrator.llm_cache, orchestrator.LLM_CACHE_ENABLED)
+        orchestrator.llm_cache = self.cache
+        orchestrator.LLM_CACHE_ENABLED = True
+
+    def tearDown(self):
+        litellm.acompletion, orchestrator.llm_cache, orchestrator.LLM_CACHE_ENABLED = self.saved
+        self.cache.close()
+        self.tmp.cleanup()
+
+    def ask(self, model, prompt="describe a book"):
+        litellm.acompletion = model
+        return asyncio.run(orchestrator.ask_model("gpt-4o", prompt, validate=parse_json))
+
+    def test_hit_skips_the_llm(self):
+        model = FakeModel('{"entityName": "Book"}')
+        self.assertEqual(self.ask(model), '{"entityName": "Book"}')
+        self.assertEqual(self.ask(model), '{"entityName": "Book"}')
+        self.assertEqual(model.calls, 1)
+
+    def test_different_prompt_misses(self):
+        model = FakeModel('{"entityName": "Book"}')
+        self.ask(model, "describe a book")
+        self.ask(model, "describe a movie")
+        self.assertEqual(model.calls, 2)
+
+    def test_failed_parse_is_not_served_from_cache(self):
+        model = FakeModel("not json at all")
+        for _ in range(2):
+            with self.assertRaises(Exception):
+                parse_json(self.ask(model))
+        self.assertEqual(model.calls, 2)
+        self.assertEqual(self.cache.stats()["entries"], 0)
+
+    def test_truncated_response_is_not_cached(self):
+        model = FakeModel('{"entityName": "Book"}', finish_reason="length")
+        self.ask(model)
+        self.ask(model)
+        self.assertEqual(model.calls, 2)
+
+class LLMCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "llm_cache.db"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_entries_survive_a_restart(self):
+        cache = LLMCache(self.path, ttl=3600)
+        cache.set("k", "content")
+        cache.close()
+        cache = LLMCache(self.path, ttl=3600)
+        self.assertEqual(cache.get("k"), "content")
+        self.assertEqual(cache.get("other"), None)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        cache.close()
+
+    def test_expired_entries_are_misses(self):
+        cache = LLMCache(self.path, ttl=-1)
+        cache.set("k", "content")
+        self.assertIsNone(cache.get("k"))
+        cache.close()
+
+    def test_memory_tier_is_bounded(self):
+        cache = LLMCache(self.path, ttl=3600, max_entries=2)
+        for key in "abc":
+            cache.set(key, key)
+        self.assertEqual(cache.stats()["entries"], 2)
+        # Evicted from memory, still served from SQLite
+        self.assertEqual(cache.get("a"), "a")
+        cache.close()
+
+class LiteralsTest(unittest.TestCase):
+    literals = {"__ENTITY__": "Book"}
+
+    def test_whole_words_and_derived_identifiers_are_generalized(self):
+        self.assertEqual(
+            generalize('class BookCreate: "Book" Bookmark eBook', self.literals),
+            'class __ENTITY__Create: "__ENTITY__" Bookmark eBook'
+        )
+
+    def test_round_trip_to_another_entity(self):
+        cached = generalize("Book, BookCreate and Bookmark", self.literals)
+        self.assertEqual(
+            specialize(cached, {"__ENTITY__": "Movie"}),
+            "Movie, MovieCreate and Bookmark"
+        )
+
+    def test_short_values_are_left_alone(self):
+        self.assertEqual(generalize("A cat", {"__ENTITY__": "A"}), "A cat")
+        self.assertIsNone(orchestrator.entity_literals("A"))
+        prompt, literals = orchestrator.build_schema_prompt(
+            orchestrator.GenerateSchemaRequest(prompt="a list", entityName="A")
+        )
+        self.assertIsNone(literals)
+        self.assertIn("Entity name hint: A", prompt)
+
+if __name__ == "__main__":
+    unittest.main()
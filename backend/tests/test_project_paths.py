@@ -0,0 +1,78 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+os.environ.setdefault("LITELLM_LOCAL_MODEL_COST_MAP", "True")
+os.environ["LLM_CACHE_ENABLED"] = "false"
+# orchestrator creates its databases and generated/ in the working directory
+os.chdir(tempfile.mkdtemp())
+
+from fastapi import HTTPException  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+import orchestrator  # noqa: E402
+
+class ResolveProjectDirTest(unittest.TestCase):
+    def test_valid_id_resolves_under_generated(self):
+        project_dir = orchestrator.resolve_project_dir("0123abcd")
+        self.assertEqual(project_dir.name, "0123abcd")
+        self.assertEqual(project_dir.parent.name, "generated")
+
+    def test_bad_ids_are_rejected(self):
+        for project_id in ["..", "../etc", "0123ABCD", "0123abc", "0123abcd/..", ""]:
+            with self.subTest(project_id=project_id):
+                with self.assertRaises(HTTPException) as ctx:
+                    orchestrator.resolve_project_dir(project_id)
+                self.assertEqual(ctx.exception.status_code, 400)
+
+    def test_endpoints_reject_bad_id(self):
+        client = TestClient(orchestrator.app)
+        for path in ["/api/projects/not-an-id/files", "/api/projects/not-an-id/download"]:
+            with self.subTest(path=path):
+                self.assertEqual(client.get(path).status_code, 400)
+
+class ResolveProjectFileTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name).resolve()
+        self.project_dir = root / "project"
+        (self.project_dir / "templates").mkdir(parents=True)
+        (self.project_dir / "templates" / "index.html").write_text("<html></html>")
+        (root / "secret.txt").write_text("secret")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def assertRejected(self, file_path):
+        with self.assertRaises(HTTPException) as ctx:
+            orchestrator.resolve_project_file(self.project_dir, file_path)
+        self.assertEqual(ctx.exception.status_code, 400)
+
+    def test_nested_file_resolves(self):
+        self.assertEqual(
+            orchestrator.resolve_project_file(self.project_dir, "templates/index.html"),
+            self.project_dir / "templates" / "index.html"
+        )
+
+    def test_parent_segments_are_rejected(self):
+        for file_path in ["../secret.txt", "templates/../../secret.txt", "templates/.."]:
+            with self.subTest(file_path=file_path):
+                self.assertRejected(file_path)
+
+    def test_absolute_path_is_rejected(self):
+        self.assertRejected(str(Path(self.tmp.name) / "secret.txt"))
+        self.assertRejected("/etc/passwd")
+
+    def test_symlink_escape_is_rejected(self):
+        link = self.project_dir / "escape.txt"
+        try:
+            link.symlink_to(Path(self.tmp.name) / "secret.txt")
+        except OSError:
+            self.skipTest("symlinks are not supported here")
+        self.assertRejected("escape.txt")
+
+if __name__ == "__main__":
+    unittest.main()
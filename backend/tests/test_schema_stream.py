@@ -0,0 +1,118 @@
+import asyncio
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import orjson
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+os.environ.setdefault("LITELLM_LOCAL_MODEL_COST_MAP", "True")
+os.environ["LLM_CACHE_ENABLED"] = "false"
+# orchestrator creates its databases and generated/ in the working directory
+os.chdir(tempfile.mkdtemp())
+
+import litellm  # noqa: E402
+import orchestrator  # noqa: E402
+
+LLM_OUTPUT = (
+    '```json\n{"entityName": "Book", "meta": {"x": {"y": 1}}, "fields": ['
+    '{"name": "title", "label": "Title", "type": "string", "required": true}, '
+    '{"name": "pages", "label": "Pages", "type": "number", "required": false}'
+    ']}\n```'
+)
+
+def chunk(text):
+    delta = type("Delta", (), {"content": text})()
+    return type("Chunk", (), {"choices": [type("Choice", (), {"delta": delta})()]})()
+
+async def fake_acompletion(**kwargs):
+    async def stream():
+        for i in range(0, len(LLM_OUTPUT), 16):
+            await asyncio.sleep(0)
+            yield chunk(LLM_OUTPUT[i:i + 16])
+    return stream()
+
+async def post_raw(path, body, headers):
+    """Drive the ASGI app directly and return every message it sends."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(k.encode(), v.encode()) for k, v in headers.items()],
+        "client": ("127.0.0.1", 1234),
+        "server": ("testserver", 80),
+    }
+    request_sent = False
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await asyncio.sleep(3600)
+
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    await orchestrator.app(scope, receive, send)
+    return messages
+
+class SchemaStreamTest(unittest.TestCase):
+    def setUp(self):
+        self.original = litellm.acompletion
+        litellm.acompletion = fake_acompletion
+
+    def tearDown(self):
+        litellm.acompletion = self.original
+
+    def test_fields_arrive_incrementally_with_gzip_accepted(self):
+        messages = asyncio.run(post_raw(
+            "/api/generate-schema/stream",
+            orjson.dumps({"prompt": "a book library"}),
+            {"content-type": "application/json", "accept-encoding": "gzip"},
+        ))
+        start = messages[0]
+        self.assertEqual(start["status"], 200)
+        self.assertNotIn((b"content-encoding", b"gzip"), start["headers"])
+
+        bodies = [m for m in messages[1:] if m["type"] == "http.response.body" and m.get("body")]
+        events = [orjson.loads(m["body"]) for m in bodies]
+        self.assertEqual([e["type"] for e in events], ["field", "field", "schema"])
+        # Field events are sent while the stream is still open, not in one final flush
+        self.assertTrue(all(m.get("more_body") for m in bodies[:2]))
+        self.assertEqual([e["field"]["name"] for e in events[:2]], ["title", "pages"])
+
+class JsonItemScannerTest(unittest.TestCase):
+    def test_only_array_elements_are_items(self):
+        scanner = orchestrator.JsonItemScanner()
+        items = []
+        for i in range(0, len(LLM_OUTPUT), 5):
+            items += scanner.feed(LLM_OUTPUT[i:i + 5])
+        self.assertEqual([orjson.loads(item)["name"] for item in items], ["title", "pages"])
+
+class ResponseCleanupTest(unittest.TestCase):
+    def test_clean_code_strips_fences(self):
+        self.assertEqual(orchestrator.clean_code("```python\nx = 1\n```"), "x = 1")
+        self.assertEqual(orchestrator.clean_code("```\nx = 1\n```"), "x = 1")
+        self.assertEqual(orchestrator.clean_code("  x = 1  "), "x = 1")
+        self.assertEqual(orchestrator.clean_code("Here:\n```json\n{}\n```\nDone"), "Here:\n{}\nDone")
+
+    def test_extract_json_object_skips_braces_in_strings(self):
+        text = 'Sure! {"a": "}{", "b": {"c": 1}} trailing {"d": 2}'
+        self.assertEqual(orchestrator.extract_json_object(text), '{"a": "}{", "b": {"c": 1}}')
+        self.assertIsNone(orchestrator.extract_json_object("no object here"))
+        self.assertIsNone(orchestrator.extract_json_object('{"unterminated": 1'))
+
+if __name__ == "__main__":
+    unittest.main()
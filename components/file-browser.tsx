@@ -62,9 +62,9 @@ export function FileBrowser({ projectId }: FileBrowserProps) {
         throw new Error("Failed to load file content")
       }
 
-      const data = await response.json()
+      const content = await response.text()
       console.log("[v0] Loaded file content for:", filePath)
-      setFileContent(data.content)
+      setFileContent(content)
     } catch (error) {
       console.error("[v0] Error loading file content:", error)
       setFileContent("Error loading file content")